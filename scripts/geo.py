@@ -1,3 +1,4 @@
+import io
 import re
 import json
 import math
@@ -5,6 +6,8 @@ from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Any, Iterable, Mapping, Sequence
 
+import numpy as np
+import shapely
 from shapely.geometry import (
     Point,
     LineString,
@@ -14,10 +17,13 @@ from shapely.geometry import (
     GeometryCollection,
 )
 from shapely.geometry.base import BaseGeometry
-from shapely.ops import transform, unary_union
-from shapely.affinity import rotate, scale
 from pyproj import CRS, Transformer
 
+try:  # Optional fast JSON serializer
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 try:  # Support running as module or script
     from .waypoint_lookup import lookup_waypoint
 except ImportError:  # pragma: no cover
@@ -27,6 +33,34 @@ except ImportError:  # pragma: no cover
 # Heuristic: maximum radius (NM) we represent as a circle polygon; larger areas fallback to a point
 MAX_CIRCLE_RADIUS_NM = 200
 
+# Coordinate / distance / altitude patterns (compiled once at import).
+# Coordinate digits are ASCII-only: dms_digits_to_deg decodes raw bytes.
+LATLON_PAIR_RE = re.compile(r"([0-9]{4,6}[NS])\s*([0-9]{5,7}[EW])")
+LATLON_GROUPS_RE = re.compile(r"([0-9]{4,6})([NS])\s*([0-9]{5,7})([EW])")
+LATLON_PAIR_NOSPACE_RE = re.compile(r"([0-9]{4,6}[NS])([0-9]{5,7}[EW])")
+LAT_TOKEN_RE = re.compile(r"[0-9]{4,6}[NS]")
+LON_TOKEN_RE = re.compile(r"[0-9]{5,7}[EW]")
+DIST_RE = re.compile(r"(\d+(?:\.\d+)?)(KM|NM|M)")
+ALT_FL_RE = re.compile(r"FL(\d{2,3})")
+ALT_M_REF_RE = re.compile(r"(\d+(?:\.\d+)?)M\s+(AMSL|AGL)")
+ALT_M_RE = re.compile(r"(\d+(?:\.\d+)?)M")
+
+# DMS digit count -> (prefix, suffix) padding to the 7-digit DDDMMSS layout
+DMS_PAD: Dict[int, Tuple[str, str]] = {
+    4: ("0", "00"),
+    5: ("", "00"),
+    6: ("0", ""),
+    7: ("", ""),
+}
+# Seconds contributed by each DDDMMSS digit
+DMS_DIGIT_WEIGHTS = np.array([360000, 36000, 3600, 600, 60, 10, 1], dtype=np.int64)
+
+# HTML / whitespace normalization patterns
+HTML_BR_RE = re.compile(r"<br\s*/?>", re.I)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+MULTI_NEWLINE_RE = re.compile(r"\n{2,}")
+MULTI_SPACE_RE = re.compile(r"[ ]{2,}")
+
 # ============== Utilities ==============
 
 
@@ -39,35 +73,25 @@ def dms_token_to_deg(token: str) -> float:
     Supports DDMMSS or DDMM and N/S/E/W.
     """
     token = token.strip()
-    m = re.fullmatch(r"(\d{4,7})([NSEW])", token)
-    if not m:
+    # 4-7 digits and a hemisphere letter, checked with plain string tests
+    num, hemi = token[:-1], token[-1:]
+    if not (4 <= len(num) <= 7 and hemi in "NSEW" and num.isascii() and num.isdigit()):
         raise ValueError(f"Bad DMS token: {token}")
-    num, hemi = m.groups()
-    # Split into degrees, minutes, seconds depending on length
-    if len(num) == 7:
-        dd = int(num[:3])
-        mm = int(num[3:5])
-        ss = int(num[5:7])
-    elif len(num) == 6:
-        dd = int(num[:2])
-        mm = int(num[2:4])
-        ss = int(num[4:6])
-    elif len(num) == 5:
-        dd = int(num[:3])
-        mm = int(num[3:5])
-        ss = 0
-    elif len(num) == 4:
-        dd = int(num[:2])
-        mm = int(num[2:4])
-        ss = 0
-    else:
-        # Fallback or error?
-        raise ValueError(f"Unexpected DMS length {len(num)} in {token}")
+    return dms_parts_to_deg(num, hemi)
 
-    deg = dd + mm / 60.0 + ss / 3600.0
-    if hemi in ("S", "W"):
-        deg = -deg
-    return deg
+
+def dms_parts_to_deg(num: str, hemi: str) -> float:
+    """
+    Convert already-validated DMS digits ('595835') and hemisphere ('N') to degrees.
+    """
+    # One int() over the digits, then split DD(D)MM[SS] arithmetically
+    n = int(num)
+    if len(num) < 6:
+        secs = (n // 100) * 3600 + (n % 100) * 60
+    else:
+        secs = (n // 10000) * 3600 + (n // 100 % 100) * 60 + n % 100
+    deg = secs / 3600.0
+    return -deg if hemi in "SW" else deg
 
 
 def parse_latlon_pair(pair: str) -> Tuple[float, float]:
@@ -75,19 +99,28 @@ def parse_latlon_pair(pair: str) -> Tuple[float, float]:
     Parse '595835N0301229E' into (lon, lat) decimal degrees.
     Also supports '595835N 0301229E' or with separators.
     """
+    # Fast path: the compact / space-separated form used by almost every NOTAM
+    m = LATLON_GROUPS_RE.fullmatch(pair)
+    if m:
+        lat_num, lat_hemi, lon_num, lon_hemi = m.groups()
+        return (
+            dms_parts_to_deg(lon_num, lon_hemi),
+            dms_parts_to_deg(lat_num, lat_hemi),
+        )
+
     s = pair.strip().replace(",", " ").replace("-", " ").replace("–", " ")
     # Try to split by letter boundary
-    m = re.fullmatch(r"(\d{4,6}[NS])\s*(\d{5,7}[EW])", s)
+    m = LATLON_PAIR_RE.fullmatch(s)
     if not m:
         # try with missing spaces
-        m = re.match(r"(\d{4,6}[NS])(\d{5,7}[EW])", s)
+        m = LATLON_PAIR_NOSPACE_RE.match(s)
     if not m:
         # try explicit spacing tokens split
         toks = s.split()
         if (
             len(toks) >= 2
-            and re.match(r"\d{4,6}[NS]", toks[0])
-            and re.match(r"\d{5,7}[EW]", toks[1])
+            and LAT_TOKEN_RE.match(toks[0])
+            and LON_TOKEN_RE.match(toks[1])
         ):
             lat_tok, lon_tok = toks[0], toks[1]
         else:
@@ -100,6 +133,18 @@ def parse_latlon_pair(pair: str) -> Tuple[float, float]:
     return (lon, lat)
 
 
+def dms_digits_to_deg(nums: Sequence[str], hemis: Sequence[str]) -> np.ndarray:
+    """
+    Vectorized dms_token_to_deg for already-split digit strings and hemisphere letters.
+    Every token is padded to the 7-digit DDDMMSS layout and decoded in one numpy pass.
+    """
+    padded = "".join(DMS_PAD[len(n)][0] + n + DMS_PAD[len(n)][1] for n in nums)
+    digits = np.frombuffer(padded.encode("ascii"), dtype=np.uint8).reshape(-1, 7)
+    secs = (digits.astype(np.int64) - 48) @ DMS_DIGIT_WEIGHTS
+    sign = np.where(np.isin(np.asarray(hemis), ("S", "W")), -1.0, 1.0)
+    return sign * (secs / 3600.0)
+
+
 def parse_multi_latlon_seq(text: str) -> List[Tuple[float, float]]:
     """
     Parse sequences like:
@@ -107,26 +152,40 @@ def parse_multi_latlon_seq(text: str) -> List[Tuple[float, float]]:
     into [(lon,lat), ...]
     scan text for all coordinate occurrences.
     """
-    # Pattern:
-    # 1. Lat (4-6 digits + N/S)
+    # LATLON_GROUPS_RE:
+    # 1. Lat digits (4-6) + N/S
     # 2. Separator (optional space, or none)
-    # 3. Lon (5-7 digits + E/W)
-    # Note: Regex from parse_latlon_pair logic
-    pat = re.compile(r"(\d{4,6}[NS])\s*(\d{5,7}[EW])")
+    # 3. Lon digits (5-7) + E/W
+    matches = LATLON_GROUPS_RE.findall(text)
+    if not matches:
+        return []
+    lat_nums, lat_hemis, lon_nums, lon_hemis = zip(*matches)
+    lats = dms_digits_to_deg(lat_nums, lat_hemis)
+    lons = dms_digits_to_deg(lon_nums, lon_hemis)
+    return list(zip(lons.tolist(), lats.tolist()))
 
-    coords = []
-    for m in pat.finditer(text):
-        lat_tok, lon_tok = m.groups()
-        try:
-            lat = dms_token_to_deg(lat_tok)
-            lon = dms_token_to_deg(lon_tok)
-            coords.append((lon, lat))
-        except ValueError:
-            continue
 
-    return coords
+# Number of decimals the AEQD origin is rounded to when caching projections
+# (6 decimals ~ 0.1 m, well below NOTAM coordinate precision).
+PROJECTION_CACHE_DECIMALS = 6
+
+WGS84 = CRS.from_epsg(4326)
+
+# WGS84 ellipsoid parameters for the spherical AEQD approximation
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_E2 = WGS84_F * (2 - WGS84_F)
+# Up to this distance from the centre the spherical approximation stays within
+# 0.5 m of the exact AEQD inverse (about 0.35 m at the limit); larger shapes go
+# through pyproj.
+SPHERICAL_APPROX_MAX_RADIUS_M = 20_000.0
 
+# Number of memoized circle/sector/ellipse polygons kept per shape. NOTAM files
+# repeat the same areas across altitude bands and re-issued NOTAMs.
+GEOMETRY_CACHE_SIZE = 8192
 
+
+@lru_cache(maxsize=4096)
 def local_equal_area_crs(lon: float, lat: float) -> CRS:
     """
     Build a local Azimuthal Equidistant CRS centered on the given lon/lat,
@@ -137,16 +196,107 @@ def local_equal_area_crs(lon: float, lat: float) -> CRS:
     )
 
 
+@lru_cache(maxsize=4096)
+def _get_transformers(lon0: float, lat0: float) -> Tuple[Transformer, Transformer]:
+    """
+    Return the (forward, inverse) WGS84 <-> local AEQD Transformer pair.
+    Transformer construction dominates the cost of a projection, so pairs are cached.
+    """
+    dst = local_equal_area_crs(lon0, lat0)
+    fwd = Transformer.from_crs(WGS84, dst, always_xy=True)
+    inv = Transformer.from_crs(dst, WGS84, always_xy=True)
+    return fwd, inv
+
+
+def round_center(center: Tuple[float, float]) -> Tuple[float, float]:
+    """
+    Round a (lon, lat) center to the precision used as a cache key.
+    """
+    lon0, lat0 = center
+    return (
+        round(lon0, PROJECTION_CACHE_DECIMALS),
+        round(lat0, PROJECTION_CACHE_DECIMALS),
+    )
+
+
+def get_transformers(center: Tuple[float, float]) -> Tuple[Transformer, Transformer]:
+    """
+    Return the cached (forward, inverse) Transformer pair for an AEQD centered at 'center' (lon,lat).
+    """
+    return _get_transformers(*round_center(center))
+
+
+def project_geoms(
+    geoms: Sequence[BaseGeometry], center: Tuple[float, float], inverse=False
+):
+    """
+    Project several geometries to/from local AEQD centered at 'center' (lon,lat).
+    All vertices are pushed through a single array Transformer.transform call.
+    """
+    fwd, inv = get_transformers(center)
+    tr = inv if inverse else fwd
+
+    def _xy(coords: np.ndarray) -> np.ndarray:
+        xs, ys = tr.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack((xs, ys))
+
+    return list(shapely.transform(np.asarray(geoms, dtype=object), _xy))
+
+
 def project_geom(geom, center: Tuple[float, float], inverse=False):
     """
     Project geometry to/from local AEQD centered at 'center' (lon,lat).
     """
+    return project_geoms([geom], center, inverse=inverse)[0]
+
+
+def aeqd_inverse_spherical(
+    center: Tuple[float, float], xs: np.ndarray, ys: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Approximate inverse of the local AEQD projection without pyproj.
+    Offsets are scaled by the ellipsoid's meridional (M) and prime vertical (N)
+    radii of curvature at the centre and then walked along a great circle of a
+    unit sphere, which is exact to first order and within 0.5 m up to
+    SPHERICAL_APPROX_MAX_RADIUS_M.
+    """
     lon0, lat0 = center
-    src = CRS.from_epsg(4326)
-    dst = local_equal_area_crs(lon0, lat0)
-    fwd = Transformer.from_crs(src, dst, always_xy=True).transform
-    inv = Transformer.from_crs(dst, src, always_xy=True).transform
-    return transform(inv if inverse else fwd, geom)
+    phi = math.radians(lat0)
+    sin_phi, cos_phi = math.sin(phi), math.cos(phi)
+    w = 1.0 - WGS84_E2 * sin_phi * sin_phi
+    n_radius = WGS84_A / math.sqrt(w)
+    m_radius = WGS84_A * (1.0 - WGS84_E2) / (w * math.sqrt(w))
+    u = np.asarray(xs) / n_radius
+    v = np.asarray(ys) / m_radius
+    dist = np.hypot(u, v)
+    sin_d, cos_d = np.sin(dist), np.cos(dist)
+    # The azimuth's sine and cosine are u/dist and v/dist, so fold them into
+    # sin(dist)/dist (-> 1 at the centre) instead of taking atan2, sin and cos.
+    sin_d_per_d = np.divide(sin_d, dist, out=np.ones_like(dist), where=dist > 0)
+    # cos(lat0) * sin(dist) / dist is shared by the latitude and longitude terms
+    scale = cos_phi * sin_d_per_d
+    sin_lat2 = sin_phi * cos_d + scale * v
+    lats = np.degrees(np.arcsin(sin_lat2))
+    dlon = np.arctan2(u * scale, cos_d - sin_phi * sin_lat2)
+    return lon0 + np.degrees(dlon), lats
+
+
+def local_to_lonlat(
+    center: Tuple[float, float],
+    xs: np.ndarray,
+    ys: np.ndarray,
+    max_dist_m: float,
+    use_spherical_approx: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Inverse-project local AEQD meters around 'center' to lon/lat arrays.
+    'max_dist_m' bounds the distance of the points from the centre; small shapes
+    use aeqd_inverse_spherical and skip pyproj entirely.
+    """
+    if use_spherical_approx and max_dist_m <= SPHERICAL_APPROX_MAX_RADIUS_M:
+        return aeqd_inverse_spherical(center, xs, ys)
+    _, inv = get_transformers(center)
+    return inv.transform(xs, ys)
 
 
 def km(value: float) -> float:
@@ -158,11 +308,12 @@ def normalize_notam_text(text: str) -> str:
     Normalize NOTAM text by stripping simple HTML fragments and normalizing whitespace.
     """
     t = text.replace("&nbsp;", " ")
-    t = re.sub(r"<br\s*/?>", "\n", t, flags=re.I)
-    t = re.sub(r"<[^>]+>", " ", t)
-    t = re.sub(r"[\t\r]+", " ", t)
-    t = re.sub(r"\n{2,}", "\n", t)
-    t = re.sub(r"[ ]{2,}", " ", t)
+    t = HTML_BR_RE.sub("\n", t)
+    t = HTML_TAG_RE.sub(" ", t)
+    # Tabs/CRs become spaces; the runs this leaves are collapsed by MULTI_SPACE_RE
+    t = t.replace("\t", " ").replace("\r", " ")
+    t = MULTI_NEWLINE_RE.sub("\n", t)
+    t = MULTI_SPACE_RE.sub(" ", t)
     return t.strip()
 
 
@@ -197,7 +348,7 @@ def m_from_text(val_text: str) -> float:
     Convert '5KM' -> 5000, '0.5KM' -> 500, '500M' -> 500, '1NM' -> 1852.
     """
     t = val_text.strip().upper().replace(" ", "")
-    m = re.match(r"(\d+(?:\.\d+)?)(KM|NM|M)", t)
+    m = DIST_RE.match(t)
     if not m:
         raise ValueError(f"Cannot parse distance: {val_text}")
     v, unit = m.groups()
@@ -220,11 +371,11 @@ def parse_alt_text(alt: str) -> Dict[str, Any]:
     if t in ("SFC", "GND"):
         return {"type": t}
     # FLxxx
-    m = re.fullmatch(r"FL(\d{2,3})", t)
+    m = ALT_FL_RE.fullmatch(t)
     if m:
         return {"type": "ALT", "unit": "FL", "value": int(m.group(1))}
     # meters AMSL/AGL
-    m = re.fullmatch(r"(\d+(?:\.\d+)?)M\s+(AMSL|AGL)", t)
+    m = ALT_M_REF_RE.fullmatch(t)
     if m:
         return {
             "type": "ALT",
@@ -233,7 +384,7 @@ def parse_alt_text(alt: str) -> Dict[str, Any]:
             "ref": m.group(2),
         }
     # meters only
-    m = re.fullmatch(r"(\d+(?:\.\d+)?)M", t)
+    m = ALT_M_RE.fullmatch(t)
     if m:
         return {"type": "ALT", "unit": "M", "value": float(m.group(1))}
     # empty
@@ -288,17 +439,59 @@ def build_polygon(coords: List[Tuple[float, float]]) -> Polygon:
     return poly
 
 
+@lru_cache(maxsize=64)
+def unit_circle_xy(n_segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unit circle vertices in the order shapely's buffer emits them:
+    clockwise, starting on the +x axis, without the closing vertex.
+    """
+    angles = np.linspace(0.0, 2.0 * math.pi, n_segments, endpoint=False)
+    xs, ys = np.cos(angles), -np.sin(angles)
+    xs.flags.writeable = ys.flags.writeable = False
+    return xs, ys
+
+
+def fan_ring_xy(radius_m: float, angles_rad: np.ndarray) -> np.ndarray:
+    """
+    Local (x, y) ring of a circular fan: the origin, the arc vertices at
+    'angles_rad' (mathematical angles, x from East) and the origin again.
+    Shared by sectors and arcs.
+    """
+    xy = np.zeros((len(angles_rad) + 2, 2))
+    xy[1:-1, 0] = radius_m * np.cos(angles_rad)
+    xy[1:-1, 1] = radius_m * np.sin(angles_rad)
+    return xy
+
+
 def build_circle(
-    center: Tuple[float, float], radius_m: float, n_points: int = 128
+    center: Tuple[float, float],
+    radius_m: float,
+    n_points: int = 128,
+    use_spherical_approx: bool = True,
 ) -> Polygon:
     """
-    Build a circle polygon by buffering a point in local AEQD projection.
+    Build a circle polygon in local AEQD projection around 'center'.
+    Results are memoized on the rounded center and radius.
     """
-    lon, lat = center
-    p = Point(lon, lat)
-    proj = project_geom(p, center=(lon, lat), inverse=False)
-    circ = proj.buffer(radius_m, quad_segs=max(4, n_points // 4))
-    return project_geom(circ, center=(lon, lat), inverse=True)
+    return _build_circle(
+        round_center(center), round(radius_m, 1), n_points, use_spherical_approx
+    )
+
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _build_circle(
+    center: Tuple[float, float],
+    radius_m: float,
+    n_points: int,
+    use_spherical_approx: bool,
+) -> Polygon:
+    # The centre is the AEQD origin, so the ring is generated directly in
+    # projected meters and only the inverse projection is needed.
+    ux, uy = unit_circle_xy(4 * max(4, n_points // 4))
+    lons, lats = local_to_lonlat(
+        center, ux * radius_m, uy * radius_m, radius_m, use_spherical_approx
+    )
+    return Polygon(np.column_stack((lons, lats)))
 
 
 def build_line_corridor(
@@ -308,10 +501,13 @@ def build_line_corridor(
     Build a corridor polygon buffering a polyline by half_width_m.
     Uses local AEQD around the line centroid for low distortion.
     """
-    line = LineString(points)
-    centroid = line.centroid
+    pts = np.asarray(points, dtype=float)
+    centroid = LineString(pts).centroid
     center = (centroid.x, centroid.y)
-    proj = project_geom(line, center=center, inverse=False)
+    # Project the vertex arrays directly rather than a LineString geometry
+    fwd, _ = get_transformers(center)
+    xs, ys = fwd.transform(pts[:, 0], pts[:, 1])
+    proj = LineString(np.column_stack((xs, ys)))
     buf = proj.buffer(half_width_m, join_style=2)  # mitre/round: 2=mitre, 1=round
     return project_geom(buf, center=center, inverse=True)
 
@@ -322,31 +518,41 @@ def build_sector(
     az_min_deg: float,
     az_max_deg: float,
     n: int = 128,
+    use_spherical_approx: bool = True,
 ) -> Polygon:
     """
     Build an azimuth sector (fan) polygon. Bearings clockwise from North.
+    Results are memoized on the rounded center and radius.
     """
-    lon, lat = center
-    cpt = Point(lon, lat)
-    proj_cpt = project_geom(cpt, center=center, inverse=False)
+    return _build_sector(
+        round_center(center),
+        round(radius_m, 1),
+        az_min_deg,
+        az_max_deg,
+        n,
+        use_spherical_approx,
+    )
 
-    def polar_to_xy(r, bearing_deg):
-        # shapely buffer used local projection; bearings measured from North clockwise
-        theta = math.radians(90 - bearing_deg)  # convert to mathematical (x from East)
-        x = r * math.cos(theta)
-        y = r * math.sin(theta)
-        return (x, y)
 
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _build_sector(
+    center: Tuple[float, float],
+    radius_m: float,
+    az_min_deg: float,
+    az_max_deg: float,
+    n: int,
+    use_spherical_approx: bool,
+) -> Polygon:
     # handle wrap-around if az_max < az_min
     span = (az_max_deg - az_min_deg) % 360
     steps = max(8, int(n * (span / 360)))
-    pts = [polar_to_xy(0, 0)]  # center
-    for i in range(steps + 1):
-        b = (az_min_deg + i * span / steps) % 360
-        pts.append(polar_to_xy(radius_m, b))
-    pts.append(polar_to_xy(0, 0))
-    poly_local = Polygon(pts)
-    return project_geom(poly_local, center=center, inverse=True)
+    bearings = (az_min_deg + np.arange(steps + 1) * span / steps) % 360
+    # bearings are clockwise from North; convert to mathematical angles (x from East)
+    xy = fan_ring_xy(radius_m, np.radians(90 - bearings))
+    lons, lats = local_to_lonlat(
+        center, xy[:, 0], xy[:, 1], radius_m, use_spherical_approx
+    )
+    return Polygon(np.column_stack((lons, lats)))
 
 
 def build_arc(
@@ -356,16 +562,15 @@ def build_arc(
     end_pt: Tuple[float, float],
     clockwise: bool,
     n_points: int = 64,
+    use_spherical_approx: bool = True,
 ) -> Polygon:
     """
     Build an arc polygon.
     """
-    p_start = Point(start_pt)
-    p_end = Point(end_pt)
-
-    # Project to local plane
-    p_s_proj = project_geom(p_start, center=center, inverse=False)
-    p_e_proj = project_geom(p_end, center=center, inverse=False)
+    # Project both endpoints to the local plane in one call
+    p_s_proj, p_e_proj = project_geoms(
+        [Point(start_pt), Point(end_pt)], center=center, inverse=False
+    )
 
     x1, y1 = p_s_proj.x, p_s_proj.y
     x2, y2 = p_e_proj.x, p_e_proj.y
@@ -386,21 +591,21 @@ def build_arc(
             end_deg += 360.0
         diff = end_deg - start_deg
 
-    pts = [(0.0, 0.0)]
     steps = max(4, int(n_points * (diff / 360.0)))
-    for i in range(steps + 1):
-        if clockwise:
-            a = start_deg - i * (diff / steps)
-        else:
-            a = start_deg + i * (diff / steps)
-        rad = math.radians(a)
-        pts.append((radius_m * math.cos(rad), radius_m * math.sin(rad)))
-    pts.append((0.0, 0.0))
+    offsets = np.arange(steps + 1) * (diff / steps)
+    rad = np.radians(start_deg - offsets if clockwise else start_deg + offsets)
 
-    poly_local = Polygon(pts)
+    poly_local = Polygon(fan_ring_xy(radius_m, rad))
     if not poly_local.is_valid:
         poly_local = poly_local.buffer(0)
-    return project_geom(poly_local, center=center, inverse=True)
+
+    def _to_lonlat(coords: np.ndarray) -> np.ndarray:
+        lons, lats = local_to_lonlat(
+            center, coords[:, 0], coords[:, 1], radius_m, use_spherical_approx
+        )
+        return np.column_stack((lons, lats))
+
+    return shapely.transform(poly_local, _to_lonlat)
 
 
 def build_ellipse(
@@ -409,31 +614,50 @@ def build_ellipse(
     minor_km: float,
     azm_deg: float,
     n: int = 128,
+    use_spherical_approx: bool = True,
 ) -> Polygon:
     """
     Build an ellipse polygon using local AEQD projection. 'azm_deg' is heading of major axis (clockwise from North).
+    Results are memoized on the rounded center and axes.
     """
-    lon, lat = center
-    p = Point(lon, lat)
-    proj_p = project_geom(p, center=center, inverse=False)
-    # unit circle
-    circ = proj_p.buffer(1.0, quad_segs=max(4, n // 4))
+    return _build_ellipse(
+        round_center(center),
+        round(major_km, 4),
+        round(minor_km, 4),
+        azm_deg,
+        n,
+        use_spherical_approx,
+    )
+
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _build_ellipse(
+    center: Tuple[float, float],
+    major_km: float,
+    minor_km: float,
+    azm_deg: float,
+    n: int,
+    use_spherical_approx: bool,
+) -> Polygon:
+    # unit circle (the centre is the AEQD origin)
+    ux, uy = unit_circle_xy(4 * max(4, n // 4))
     # scale by semi-axes (meters)
     a = km(major_km) / 2.0
     b = km(minor_km) / 2.0
-    ell = scale(circ, xfact=a, yfact=b, origin="center")
     # rotate: azm_deg clockwise from North -> convert to mathematical angle from x-axis
-    # In projected plane, rotate positive is counter-clockwise; we want clockwise-from-North.
     # North is +y; angle from x-axis CCW == 90 - azm
-    rot_ccw = 90 - azm_deg
-    ell_rot = rotate(ell, rot_ccw, origin="center", use_radians=False)
-    return project_geom(ell_rot, center=center, inverse=True)
+    rot_ccw = math.radians(90 - azm_deg)
+    cos_r, sin_r = math.cos(rot_ccw), math.sin(rot_ccw)
+    xs = a * ux * cos_r - b * uy * sin_r
+    ys = a * ux * sin_r + b * uy * cos_r
+    lons, lats = local_to_lonlat(center, xs, ys, max(a, b), use_spherical_approx)
+    return Polygon(np.column_stack((lons, lats)))
 
 
 # ============== NOTAM Parsing ==============
 
 
-@dataclass
+@dataclass(slots=True)
 class NotamGeometryPart:
     kind: str  # 'POLYGON'|'CIRCLE'|'LINE_CORRIDOR'|'SECTOR'|'ELLIPSE'
     geom: BaseGeometry
@@ -443,7 +667,7 @@ class NotamGeometryPart:
     raw: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NotamFeature:
     qid: str
     icao: str
@@ -454,25 +678,32 @@ class NotamFeature:
 
 
 Q_HEADER_RE = re.compile(r"^\(Q(?P<qid>\d{4})/\d+\s+NOTAM[NR]?", re.I)
+# Q_HEADER_RE at the start of a (possibly indented) line of the raw file
+NOTAM_START_RE = re.compile(r"^[^\S\n]*\(Q\d{4}/\d+[^\S\n]+(?i:NOTAM)", re.M)
 FIELD_RE = re.compile(r"^\(([A-Z]\d{0,4}.*?)\)$")  # simplistic
+# Field tag 'X)' preceded by start of line, whitespace or '('
+FIELD_MARKER_RES: Dict[str, re.Pattern] = {
+    code: re.compile(rf"(?:^|\s|\()({code}\))", re.MULTILINE) for code in "ABCDEFGQ"
+}
+NEXT_FIELD_RE = re.compile(r"(?:^|\s|\()([A-G]\))", re.MULTILINE)
+BARE_FIELD_RE = re.compile(r"[A-G]\)")
 
 
 def split_notams(raw: str) -> List[str]:
     """
     Split the big file content into individual NOTAM blocks, starting with '(Qxxxx/..'.
     """
+    # NOTAM_START_RE anchors on '\n' only; normalize old Mac / Windows line ends
+    if "\r" in raw:
+        raw = raw.replace("\r\n", "\n").replace("\r", "\n")
+    # Locate every header in one pass instead of testing each line
+    starts = [m.start() for m in NOTAM_START_RE.finditer(raw)]
+    bounds = [0] + starts + [len(raw)]
     blocks = []
-    current = []
-    for line in raw.splitlines():
-        if line.strip().startswith("(Q") and Q_HEADER_RE.match(line.strip()):
-            if current:
-                blocks.append("\n".join(current).strip())
-                current = []
-        if line.strip() == "":
-            continue
-        current.append(line.rstrip())
-    if current:
-        blocks.append("\n".join(current).strip())
+    for begin, end in zip(bounds, bounds[1:]):
+        lines = [ln.rstrip() for ln in raw[begin:end].splitlines() if ln.strip()]
+        if lines:
+            blocks.append("\n".join(lines).strip())
     return blocks
 
 
@@ -487,7 +718,9 @@ def extract_field(block: str, code: str) -> Optional[str]:
     # We allow 'Q' to look for 'Q)' just in case, though Q is usually special.
     # We mainly target A-G.
 
-    pattern = re.compile(rf"(?:^|\s|\()({code}\))", re.MULTILINE)
+    pattern = FIELD_MARKER_RES.get(code) or re.compile(
+        rf"(?:^|\s|\()({code}\))", re.MULTILINE
+    )
     m = pattern.search(block)
     if not m:
         # Fallback: sometimes fields are missing ')', e.g. '(A ...' ? Quite rare for A-G.
@@ -499,9 +732,7 @@ def extract_field(block: str, code: str) -> Optional[str]:
 
     # Find start of next field to stop extraction
     # Look for any A-G followed by ) preceded by whitespace or start of line or (
-    next_field_pat = re.compile(r"(?:^|\s|\()([A-G]\))", re.MULTILINE)
-
-    m_next = next_field_pat.search(remainder)
+    m_next = NEXT_FIELD_RE.search(remainder)
     if m_next:
         # We found another field start, cut before it
         # Note: m_next.start() includes the prefix whitespace/paren if matched via group 0
@@ -512,7 +743,37 @@ def extract_field(block: str, code: str) -> Optional[str]:
     else:
         content = remainder
 
-    # Cleanup
+    return clean_field_content(content)
+
+
+def extract_fields(block: str) -> Dict[str, str]:
+    """
+    Extract all A)-G) fields of a block with a single scan for field markers.
+    Equivalent to calling extract_field(block, code) for each code present.
+    """
+    markers = list(NEXT_FIELD_RE.finditer(block))
+    fields: Dict[str, str] = {}
+    for i, m in enumerate(markers):
+        code = m.group(1)[0]
+        if code in fields:
+            continue
+        start = m.end()
+        # extract_field searches the remainder, where '^' also matches a field
+        # tag glued directly to this one (e.g. 'A)B)')
+        if BARE_FIELD_RE.match(block, start):
+            content = ""
+        elif i + 1 < len(markers):
+            content = block[start : markers[i + 1].start()]
+        else:
+            content = block[start:]
+        fields[code] = clean_field_content(content)
+    return fields
+
+
+def clean_field_content(content: str) -> str:
+    """
+    Strip whitespace and a dangling block-closing ')' from a field value.
+    """
     content = content.strip()
     # Remove trailing ')' if it looks like the end-of-notam-block paren
     # Only if the original block ended with ) and we are at the end?
@@ -527,17 +788,23 @@ def extract_field(block: str, code: str) -> Optional[str]:
 
 
 def parse_altitude_pair(block: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    f_text = extract_field(block, "F")
-    g_text = extract_field(block, "G")
+    return altitude_pair_from_fields(extract_fields(block))
+
+
+def altitude_pair_from_fields(
+    fields: Mapping[str, str],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    f_text = fields.get("F")
+    g_text = fields.get("G")
     f_parsed = parse_alt_text(f_text or "SFC")
     g_parsed = parse_alt_text(g_text or "UNL")
     return f_parsed, g_parsed
 
 
-# Pattern helpers
+# Pattern helpers. build_parts_from_E matches these against upper-cased text,
+# so they are case-sensitive.
 CIRCLE_RE = re.compile(
     r"WI\s+CIRCLE\s+RADIUS\s+([0-9.]+\s*(?:KM|NM|M))\s+CENTR(?:E|ED\s+AT)\s+\(?\s*([0-9NS\s]+[0-9EW]+)\s*\)?\.?",
-    re.I,
 )
 SECTOR_RE = re.compile(
     r"WI\s+SECTOR\s+"
@@ -547,29 +814,39 @@ SECTOR_RE = re.compile(
     r"(?:BTN\s+)?(?:AZM(?:AG)?\s+)?(\d+)\s*-\s*(\d+)\s*DEG\s+(?:FROM|CENTR(?:E|ED\s+AT))\s+\(?\s*([0-9NS\s]+[0-9EW]+)\s*\)?"
     r")"
     r"\s+RADIUS\s+([0-9.]+\s*(?:KM|NM|M))",
-    re.I,
 )
 ELLIPSE_RE = re.compile(
     r"ELLIPSE\s+CENTR(?:E|ED\s+AT)\s+\(?\s*([0-9NS\s]+[0-9EW]+)\s*\)?\s+WITH\s+AXES\s+DIMENSIONS\s+([0-9.]+)X([0-9.]+)\s*(KM|NM|M)\s+AZM\s+OF\s+MAJOR\s+AXIS\s+(\d+)",
-    re.I,
+)
+# Keyword-anchored shapes that can never overlap one another, scanned in one pass
+SHAPE_RES: Dict[str, re.Pattern] = {
+    "CIRCLE": CIRCLE_RE,
+    "SECTOR": SECTOR_RE,
+    "ELLIPSE": ELLIPSE_RE,
+}
+SHAPE_DISPATCH_RE = re.compile(
+    "|".join(f"(?P<{kind}>{rx.pattern})" for kind, rx in SHAPE_RES.items()),
 )
 ARC_RE = re.compile(
-    r"(\d{4,6}[NS]\s*\d{5,7}[EW]).*?"
+    r"([0-9]{4,6}[NS]\s*[0-9]{5,7}[EW]).*?"
     r"(?:THEN\s+)?(CLOCKWISE|ANTICLOCKWISE|COUNTER-CLOCKWISE)\s+"
     r"(?:ALONG\s+|BY\s+)?ARC\s+(?:OF\s+A?\s*CIRCLE\s+)?"
     r"RADIUS\s+(?:OF\s+)?([0-9]+(?:\.[0-9]+)?)\s*(KM|NM|M)\s+"
-    r"CENTR(?:E|ED\s+AT)\s+\(?\s*(\d{4,6}\s*[NS]\s*\d{5,7}\s*[EW])\s*\)?\s+"
-    r"TO\s+(\d{4,6}\s*[NS]\s*\d{5,7}\s*[EW])",
-    re.I | re.DOTALL,
+    r"CENTR(?:E|ED\s+AT)\s+\(?\s*([0-9]{4,6}\s*[NS]\s*[0-9]{5,7}\s*[EW])\s*\)?\s+"
+    r"TO\s+([0-9]{4,6}\s*[NS]\s*[0-9]{5,7}\s*[EW])",
+    re.DOTALL,
 )
 LINE_EITHER_SIDE_RE = re.compile(
     r"WI\s+([0-9.]+)\s*(KM|NM|M)\s+EITHER\s+SIDE\s+OF\s+LINE\s+JOINING\s+POINTS:\s*(.+)$",
-    re.I,
 )
-AREA_COORDS_RE = re.compile(r"AREA:?\s*(.+)$", re.I)
+AREA_COORDS_RE = re.compile(r"AREA:?\s*(.+)$")
 CENTRE_INLINE_RE = re.compile(r"CENTRE\s+([0-9NS]+\s*[0-9EW]+)", re.I)
 ROUTE_SEGMENTS_RE = re.compile(r"\b([A-Z0-9]{2,6})\s*-\s*([A-Z0-9]{2,6})\b")
 ROUTE_CONTEXT_RE = re.compile(r"ATS\s+RTE\s+SEGMENTS?\s+CLSD", re.I)
+ROUTE_LINE_SPLIT_RE = re.compile(r"[\n,]")
+SUBAREA_SPLIT_RE = re.compile(r"(?m)^\s*\d+\.\s*")
+ALT_FIELD_SPLIT_RE = re.compile(r"\bF\)\b|\bG\)\b")
+LINE_POINTS_END_RE = re.compile(r"\.\s|F\)|G\)")
 
 
 def parse_subareas(text: str) -> List[str]:
@@ -578,9 +855,9 @@ def parse_subareas(text: str) -> List[str]:
     If no numbers present, return [text].
     """
     # Normalize spaces
-    t = re.sub(r"\r", "", text)
+    t = text.replace("\r", "")
     # Split on lines starting with '1.' '2.'...
-    parts = re.split(r"(?m)^\s*\d+\.\s*", t)
+    parts = SUBAREA_SPLIT_RE.split(t)
     # If split produced leading preamble, drop it only if following parts exist
     if len(parts) > 1:
         # First part may be preamble text; keep but merge if contains geometry
@@ -605,12 +882,14 @@ def parse_coords_after(
     # Replace newlines
     trail_one = " ".join(trail.splitlines())
     # Some lines end with altitude text; cut at first F) or G) start
-    trail_one = re.split(r"\bF\)\b|\bG\)\b", trail_one)[0]
+    trail_one = ALT_FIELD_SPLIT_RE.split(trail_one)[0]
     coords = parse_multi_latlon_seq(trail_one)
     return coords if coords else None
 
 
 def parse_line_points(text: str) -> Optional[List[Tuple[float, float]]]:
+    if not text.isupper():
+        text = text.upper()
     m = LINE_EITHER_SIDE_RE.search(text)
     if not m:
         return None
@@ -619,7 +898,7 @@ def parse_line_points(text: str) -> Optional[List[Tuple[float, float]]]:
     # points may span multiple lines until a period
     points_str = points_str.split("\n")[0]
     # allow over multiple lines by capturing until 'F)' or end
-    points_block = re.split(r"\.\s|F\)|G\)", text[m.start() :], maxsplit=1)[0]
+    points_block = LINE_POINTS_END_RE.split(text[m.start() :], maxsplit=1)[0]
     # Extract all coords from points_block
     coords = parse_multi_latlon_seq(points_block)
     return coords if coords else None
@@ -634,7 +913,7 @@ def parse_route_segments(text: str) -> List[Tuple[str, str]]:
         return []
 
     segments: List[Tuple[str, str]] = []
-    for line in re.split(r"[\n,]", text):
+    for line in ROUTE_LINE_SPLIT_RE.split(text):
         if "-" not in line:
             continue
         m = ROUTE_SEGMENTS_RE.search(line)
@@ -651,13 +930,38 @@ def build_parts_from_E(
     Parse the E) text to construct one or more geometry parts with altitudes attached.
     """
     parts: List[NotamGeometryPart] = []
+    # Most E) texts carry no geometry at all. Everything below needs a
+    # DDMM[SS]N/S latitude token except ATS routes and the keyword shapes
+    # (whose malformed centres still have to raise), so skip the per-subarea
+    # work when none of those can be present.
+    e_upper = e_text.upper()
+    if not LAT_TOKEN_RE.search(e_upper) and not any(
+        keyword in e_upper for keyword in ("RTE", *SHAPE_RES)
+    ):
+        return parts
+
     subareas = parse_subareas(e_text)
 
     for idx, sub in enumerate(subareas, start=1):
         local_parts: List[NotamGeometryPart] = []
+        # The shape patterns are case-sensitive and run on the upper-cased text.
+        # Each needs its keyword literally; a substring test is far cheaper
+        # than a regex scan that cannot match.
+        sub_upper = sub.upper()
+        # Parts keep the matched text in its original case. Match offsets carry
+        # over unless upper() changed the length (e.g. 'ß' -> 'SS').
+        raw_source = sub if len(sub_upper) == len(sub) else sub_upper
+
+        # Circles, sectors and ellipses: one scan, re-matched with their own
+        # pattern at the found offset to get the per-shape groups.
+        shape_matches: Dict[str, List[re.Match]] = {kind: [] for kind in SHAPE_RES}
+        has_shape_keyword = any(kind in sub_upper for kind in SHAPE_RES)
+        for dm in SHAPE_DISPATCH_RE.finditer(sub_upper) if has_shape_keyword else ():
+            kind = dm.lastgroup
+            shape_matches[kind].append(SHAPE_RES[kind].match(sub_upper, dm.start()))
 
         # 1) Circle
-        for m in CIRCLE_RE.finditer(sub):
+        for m in shape_matches["CIRCLE"]:
             radius_m = m_from_text(m.group(1))
             center = parse_latlon_pair(m.group(2))
             geom = build_circle(center, radius_m)
@@ -668,12 +972,12 @@ def build_parts_from_E(
                     altitude_from=f_alt,
                     altitude_to=g_alt,
                     index=idx,
-                    raw=m.group(0),
+                    raw=raw_source[m.start() : m.end()],
                 )
             )
 
         # 2) Sector
-        for m in SECTOR_RE.finditer(sub):
+        for m in shape_matches["SECTOR"]:
             if m.group(1):
                 center_text = m.group(1)
                 az1 = float(m.group(2))
@@ -694,12 +998,12 @@ def build_parts_from_E(
                     altitude_from=f_alt,
                     altitude_to=g_alt,
                     index=idx,
-                    raw=m.group(0),
+                    raw=raw_source[m.start() : m.end()],
                 )
             )
 
         # 3) Ellipse
-        for m in ELLIPSE_RE.finditer(sub):
+        for m in shape_matches["ELLIPSE"]:
             center = parse_latlon_pair(m.group(1))
             major = float(m.group(2))
             minor = float(m.group(3))
@@ -724,16 +1028,16 @@ def build_parts_from_E(
                     altitude_from=f_alt,
                     altitude_to=g_alt,
                     index=idx,
-                    raw=m.group(0),
+                    raw=raw_source[m.start() : m.end()],
                 )
             )
 
         # 3.5) Arc
-        for m in ARC_RE.finditer(sub):
+        for m in ARC_RE.finditer(sub_upper) if "CLOCKWISE" in sub_upper else ():
             start_coord = parse_latlon_pair(m.group(1))
-            direction = m.group(2).upper()
+            direction = m.group(2)
             radius_val = float(m.group(3))
-            radius_unit = m.group(4).upper()
+            radius_unit = m.group(4)
             center_coord = parse_latlon_pair(m.group(5))
             end_coord = parse_latlon_pair(m.group(6))
 
@@ -758,12 +1062,12 @@ def build_parts_from_E(
                     altitude_from=f_alt,
                     altitude_to=g_alt,
                     index=idx,
-                    raw=m.group(0),
+                    raw=raw_source[m.start() : m.end()],
                 )
             )
 
         # 4) Line corridor "either side of line"
-        m = LINE_EITHER_SIDE_RE.search(sub)
+        m = LINE_EITHER_SIDE_RE.search(sub_upper) if "EITHER" in sub_upper else None
         if m:
             half_width_val = float(m.group(1))
             unit = m.group(2)
@@ -774,7 +1078,7 @@ def build_parts_from_E(
             else:  # M
                 half_width_km = half_width_val / 1000.0
 
-            pts = parse_line_points(sub)
+            pts = parse_line_points(sub_upper)
             if pts and len(pts) >= 2:
                 geom = build_line_corridor(pts, km(half_width_km))
                 local_parts.append(
@@ -784,12 +1088,12 @@ def build_parts_from_E(
                         altitude_from=f_alt,
                         altitude_to=g_alt,
                         index=idx,
-                        raw=m.group(0),
+                        raw=raw_source[m.start() : m.end()],
                     )
                 )
 
         # 4.5) ATS route segments: build line strings between waypoints
-        segments = parse_route_segments(sub)
+        segments = parse_route_segments(sub) if "RTE" in sub_upper else []
         for start_code, end_code in segments:
             start_pt = lookup_waypoint_coords(start_code)
             end_pt = lookup_waypoint_coords(end_code)
@@ -811,8 +1115,8 @@ def build_parts_from_E(
         # May appear as "AREA:" or "AIRSPACE CLSD WI AREA:" then coords
         # We'll extract after 'AREA:' occurrences
         area_coords = []
-        for m in AREA_COORDS_RE.finditer(sub):
-            coords = parse_coords_after(m.group(0), re.compile(r"AREA:?\s*(.+)$", re.I))
+        for m in AREA_COORDS_RE.finditer(sub_upper) if "AREA" in sub_upper else ():
+            coords = parse_coords_after(m.group(0), AREA_COORDS_RE)
             if coords and len(coords) >= 3:
                 area_coords.append(coords)
         # Special case: sometimes coords listed directly in E) without explicit "AREA"
@@ -860,12 +1164,13 @@ def parse_notam_block(block: str) -> Optional[NotamFeature]:
         return None
     qid = m.group("qid")
 
-    icao = extract_field(block, "A") or ""
-    schedule = extract_field(block, "D")
-    e_text = extract_field(block, "E") or ""
-    f_alt, g_alt = parse_altitude_pair(block)
-    b_field = extract_field(block, "B") or ""
-    c_field = extract_field(block, "C") or ""
+    fields = extract_fields(block)
+    icao = fields.get("A") or ""
+    schedule = fields.get("D")
+    e_text = fields.get("E") or ""
+    f_alt, g_alt = altitude_pair_from_fields(fields)
+    b_field = fields.get("B") or ""
+    c_field = fields.get("C") or ""
 
     parts = build_parts_from_E(e_text, f_alt, g_alt)
     return NotamFeature(
@@ -882,56 +1187,111 @@ def parse_notam_block(block: str) -> Optional[NotamFeature]:
     )
 
 
+def notam_feature_geometry(f: NotamFeature) -> BaseGeometry:
+    """
+    Combine the parts of a NOTAM into one geometry (union, or a collection if that fails).
+    """
+    geoms = [p.geom for p in f.parts]
+    # Try union for cleaner MultiPolygon if all are polygons; a single part needs none
+    try:
+        return geoms[0] if len(geoms) == 1 else shapely.unary_union(geoms)
+    except Exception:
+        # fallback to collection
+        return GeometryCollection(geoms)
+
+
+def notam_feature_properties(f: NotamFeature) -> Dict[str, Any]:
+    return {
+        "qid": f.qid,
+        "icao": f.icao,
+        "effective": f.effective,
+        "schedule": f.schedule,
+        "text": f.text,
+        "parts": [
+            {
+                "index": p.index,
+                "kind": p.kind,
+                "alt_from": p.altitude_from,
+                "alt_to": p.altitude_to,
+                "raw": p.raw,
+            }
+            for p in f.parts
+        ],
+    }
+
+
 def notams_to_geojson(features: List[NotamFeature]) -> Dict[str, Any]:
-    fc = {"type": "FeatureCollection", "features": []}
+    """
+    Build a GeoJSON FeatureCollection dict from parsed NOTAM features.
+    Geometries use mapping(): when a dict is needed it is ~3x faster than
+    json.loads(shapely.to_geojson(...)). Callers that only need serialized
+    output should use notams_to_geojson_bytes, which writes GEOS GeoJSON directly.
+    """
+    # Combine parts per NOTAM as MultiPolygon or GeometryCollection
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": mapping(notam_feature_geometry(f)),
+                "properties": notam_feature_properties(f),
+            }
+            for f in features
+            if f.parts
+        ],
+    }
+
+
+def dumps_json_bytes(obj: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def notams_to_geojson_bytes(features: List[NotamFeature]) -> bytes:
+    """
+    Serialize features straight to GeoJSON bytes without building the
+    FeatureCollection dict: geometries are written by GEOS (shapely.to_geojson)
+    and each feature is appended to the output as it is produced.
+    """
+    out = io.BytesIO()
+    out.write(b'{"type":"FeatureCollection","features":[')
+    sep = b""
     for f in features:
         if not f.parts:
             continue
-        # Combine parts per NOTAM as MultiPolygon or GeometryCollection
-        geoms = [p.geom for p in f.parts]
-        # Try union for cleaner MultiPolygon if all are polygons
-        try:
-            unioned = unary_union(geoms)
-            geom_geojson = mapping(unioned)
-        except Exception:
-            # fallback to collection
-            geom_geojson = mapping(GeometryCollection(geoms))
-
-        props = {
-            "qid": f.qid,
-            "icao": f.icao,
-            "effective": f.effective,
-            "schedule": f.schedule,
-            "text": f.text,
-            "parts": [
-                {
-                    "index": p.index,
-                    "kind": p.kind,
-                    "alt_from": p.altitude_from,
-                    "alt_to": p.altitude_to,
-                    "raw": p.raw,
-                }
-                for p in f.parts
-            ],
-        }
-        fc["features"].append(
-            {"type": "Feature", "geometry": geom_geojson, "properties": props}
-        )
-    return fc
+        out.write(sep)
+        out.write(b'{"type":"Feature","geometry":')
+        out.write(shapely.to_geojson(notam_feature_geometry(f)).encode("utf-8"))
+        out.write(b',"properties":')
+        out.write(dumps_json_bytes(notam_feature_properties(f)))
+        out.write(b"}")
+        sep = b","
+    out.write(b"]}")
+    return out.getvalue()
+
+
+def parse_notam_block_safe(block: str) -> Optional[NotamFeature]:
+    """
+    parse_notam_block that returns None instead of raising, so a single bad block
+    does not abort a whole file.
+    """
+    try:
+        return parse_notam_block(block)
+    except Exception:
+        # You may log these and continue
+        return None
 
 
 def parse_notam_file_text(raw: str) -> Dict[str, Any]:
-    blocks = split_notams(raw)
-    features: List[NotamFeature] = []
-    for blk in blocks:
-        try:
-            nf = parse_notam_block(blk)
-            if nf:
-                features.append(nf)
-        except Exception as e:
-            # You may log these and continue
-            # print(f"Error parsing block: {e}")
-            continue
+    """
+    Parse all NOTAM blocks in a file and return a GeoJSON FeatureCollection.
+    """
+    parsed = (parse_notam_block_safe(blk) for blk in split_notams(raw))
+    features: List[NotamFeature] = [nf for nf in parsed if nf]
     return notams_to_geojson(features)
 
 
@@ -947,14 +1307,66 @@ class StubNotam:
         return self.body or ""
 
 
+def merge_geometries(geoms: Sequence[BaseGeometry]) -> BaseGeometry:
+    """
+    Merge geometries into one, repairing invalid areas; falls back to a
+    GeometryCollection when they cannot be unioned.
+    """
+    try:
+        merged = shapely.unary_union(geoms) if len(geoms) > 1 else geoms[0]
+        # Ensure result is valid for area geometries
+        if not merged.is_valid and merged.geom_type in {"Polygon", "MultiPolygon"}:
+            merged = merged.buffer(0)
+    except Exception:
+        # Fallback for heterogeneous collections
+        merged = GeometryCollection(geoms)
+    return merged
+
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def e_text_geometry(e_text: str) -> Tuple[Optional[BaseGeometry], Optional[str]]:
+    """
+    Parse raw E) text into its merged geometry and the lower-cased kind of its
+    first part, or (None, None) if the text holds no geometry.
+    Memoized: retries and re-issued NOTAMs parse the same text again.
+    """
+    if e_text:
+        e_text = normalize_notam_text(e_text).upper()
+    # We pass empty altitude dicts as we only need the 2D geometry here
+    parts = build_parts_from_E(e_text, {}, {})
+    if not parts:
+        return None, None
+    return merge_geometries([p.geom for p in parts]), parts[0].kind.lower()
+
+
+def normalize_airport_locations(
+    airport_locations: Mapping[str, Mapping[str, float | str]],
+) -> Dict[str, Tuple[float, float]]:
+    """
+    Reduce an airport table ({ident: {"lat": .., "lon": ..}}) to {ident: (lon, lat)}.
+    Entries without usable coordinates are dropped, so build_geometry can use
+    the point without re-validating it for every NOTAM.
+    """
+    points: Dict[str, Tuple[float, float]] = {}
+    for ident, ap in airport_locations.items():
+        try:
+            points[ident] = (float(ap["lon"]), float(ap["lat"]))
+        except (ValueError, KeyError, TypeError):
+            continue
+    return points
+
+
 def build_geometry(
     notam: Any,
-    airport_locations: Mapping[str, Mapping[str, float | str]],
+    airport_locations: Mapping[str, Mapping[str, float | str] | Tuple[float, float]],
     max_circle_radius_nm: float = MAX_CIRCLE_RADIUS_NM,
+    simplify_tolerance_deg: Optional[float] = None,
 ) -> Optional[Dict[str, Any]]:
     """
     Adapter function to be compatible with scripts/geo.py build_geometry interface.
     Extracts geometry from a Notam object (or string) using high-precision parsing.
+    If 'simplify_tolerance_deg' is given, the result is Douglas-Peucker simplified
+    with that tolerance (topology preserved) to shrink dense circle/arc rings.
     """
     e_text = ""
     # Try pynotam Notam object attributes
@@ -966,17 +1378,12 @@ def build_geometry(
     elif isinstance(notam, str):
         e_text = notam
 
-    if e_text:
-        e_text = normalize_notam_text(e_text)
-        e_text = e_text.upper()
-
-    # Parse Item E text
-    # We pass empty altitude dicts as we only need the 2D geometry here
-    parts = build_parts_from_E(e_text, {}, {})
-    geoms = [p.geom for p in parts]
+    # Parse Item E text (memoized on the raw text)
+    text_geom, first_kind = e_text_geometry(e_text)
+    geoms: List[BaseGeometry] = []
 
     # Fallback to structured data if no geometry found in text
-    if not geoms:
+    if text_geom is None:
         # Check 'area' attribute (pynotam parsed structure)
         area = getattr(notam, "area", None)
         if isinstance(area, Mapping):
@@ -1005,31 +1412,28 @@ def build_geometry(
             if locs and len(locs) > 0:
                 first = locs[0]
                 ap = airport_locations.get(first)
-                if ap:
+                if isinstance(ap, tuple):
+                    # Pre-validated (lon, lat) from normalize_airport_locations
+                    geoms.append(Point(ap))
+                elif ap:
                     try:
                         geoms.append(Point(float(ap["lon"]), float(ap["lat"])))
                     except (ValueError, KeyError, TypeError):
                         pass
 
-    if not geoms:
+    if text_geom is not None:
+        final_geom = text_geom
+    elif geoms:
+        final_geom = merge_geometries(geoms)
+    else:
         return None
 
-    # Merge geometries
-    try:
-        final_geom = unary_union(geoms) if len(geoms) > 1 else geoms[0]
-        # Ensure result is valid for area geometries
-        if not final_geom.is_valid and final_geom.geom_type in {
-            "Polygon",
-            "MultiPolygon",
-        }:
-            final_geom = final_geom.buffer(0)
-    except Exception:
-        # Fallback for heterogeneous collections
-        final_geom = GeometryCollection(geoms)
+    if simplify_tolerance_deg:
+        final_geom = final_geom.simplify(simplify_tolerance_deg, preserve_topology=True)
 
     out = mapping(final_geom)
     # Add metadata for tests (infer from first part found in text)
-    if parts:
-        out["meta"] = {"shape": parts[0].kind.lower()}
+    if first_kind:
+        out["meta"] = {"shape": first_kind}
 
     return out
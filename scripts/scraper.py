@@ -7,21 +7,52 @@ from datetime import datetime, timezone
 from urllib.parse import parse_qs, urljoin, urlparse
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from bs4.element import Tag
 import notam  # pynotam library
 
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 # Local geometry utilities (extracted for testability)
 try:  # Support running as module or script
-    from .geo import build_geometry, MAX_CIRCLE_RADIUS_NM
+    from .geo import (
+        build_geometry,
+        normalize_airport_locations,
+        MAX_CIRCLE_RADIUS_NM,
+    )
 except ImportError:  # pragma: no cover
-    from geo import build_geometry, MAX_CIRCLE_RADIUS_NM  # type: ignore
+    from geo import (  # type: ignore
+        build_geometry,
+        normalize_airport_locations,
+        MAX_CIRCLE_RADIUS_NM,
+    )
 
 BASE_URL: str = "https://www.caica.ru/ANI_Official/notam/notam_series/"
 RUN_HISTORY_PATH = pathlib.Path("docs/run_history.json")
 INTERPRETATION_FAILURES_PATH = pathlib.Path("docs/interpretation_failures.json")
 RUN_HISTORY_LIMIT = 90
 ESCALATION_THRESHOLD_DAYS = 3
+
+# Patterns are compiled once at import; the record helpers below run for every
+# NOTAM on every scrape.
+NOTAM_FILENAME_RE = re.compile(r"(?P<filename>[A-Z]\d{10}_eng\.html)")
+ONCLICK_LOCATION_RE = re.compile(r"location='([^']+)'")
+WHITESPACE_RE = re.compile(r"\s+")
+RECORD_START_RE = re.compile(r"\([A-Z]\d{4}/\d{2}(?:[A-Z]\d{1,3})?\s+NOTAM[A-Z]?\b")
+RECORD_ID_RE = re.compile(r"^\(([A-Z]\d{4}/\d{2}(?:[A-Z]\d{1,3})?)\s+NOTAM")
+SECTION_HEADER_RE = re.compile(r"(?m)^[A-Z]{3,5}:\s*$\n?")
+BROKEN_LABEL_RE = re.compile(r"([A-Z])\s*\n\s*\)")
+Q_DOUBLE_SLASH_RE = re.compile(r"(?m)^Q\)([^\n]*)//([^\n]*)$")
+BLANK_BEFORE_LABEL_RE = re.compile(r"\n\s*\n(?=[A-Z]\))")
+Q_EMPTY_FIELDS_RE = re.compile(r"(?m)^Q\)([A-Z]{4}/[A-Z]{5})//([A-Z]{1,3})/")
+Q_MISSING_FIELDS_RE = re.compile(
+    r"(?m)^Q\)([A-Z]{4}/[A-Z]{5})/([A-Z]{1,3})/(\d{3}/\d{3}/)"
+)
+AIRSPACE_CLASS_PAREN_RE = re.compile(r"\((AIRSPACE CLASS [A-Z])\)")
+NBSP_TO_SPACE = str.maketrans("\xa0", " ")
 # NOTE: MAX_CIRCLE_RADIUS_NM now imported from geo.py
 
 
@@ -49,8 +80,6 @@ def parse_html_entries(html: str) -> List[dict[str, str]]:
     soup = BeautifulSoup(html, "html.parser")
     entries: List[dict[str, str]] = []
     seen_filenames: set[str] = set()
-    rx = re.compile(r"(?P<filename>[A-Z]\d{10}_eng\.html)")
-
     for node in soup.find_all("td"):
         if isinstance(node, Tag):
             onclick_val = node.get("onclick")
@@ -63,7 +92,7 @@ def parse_html_entries(html: str) -> List[dict[str, str]]:
                         seen_filenames.add(filename)
                     continue
 
-                match = rx.search(onclick_val)
+                match = NOTAM_FILENAME_RE.search(onclick_val)
                 if match:
                     filename = match.group("filename")
                     if filename not in seen_filenames:
@@ -82,7 +111,7 @@ def extract_direct_notam_url(onclick_value: str) -> Optional[str]:
     if "uri=" not in onclick_value:
         return None
 
-    match = re.search(r"location='([^']+)'", onclick_value)
+    match = ONCLICK_LOCATION_RE.search(onclick_value)
     if not match:
         return None
 
@@ -92,7 +121,7 @@ def extract_direct_notam_url(onclick_value: str) -> Optional[str]:
     if not uri_values:
         return None
 
-    direct_url = re.sub(r"\s+", "", uri_values[0])
+    direct_url = WHITESPACE_RE.sub("", uri_values[0])
     if not direct_url.endswith("_eng.html"):
         return None
     if direct_url.startswith("//"):
@@ -102,6 +131,18 @@ def extract_direct_notam_url(onclick_value: str) -> Optional[str]:
     return f"https://{direct_url.lstrip('/')}"
 
 
+def normalize_line_breaks(text: str) -> str:
+    """Convert CR/CRLF line endings to LF and non-breaking spaces to spaces.
+
+    Most pages contain neither, so each rewrite is only done when needed.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\xa0" in text:
+        text = text.translate(NBSP_TO_SPACE)
+    return text
+
+
 def extract_notam_records(raw_text: str) -> List[str]:
     """Extract NOTAM records from raw page text.
 
@@ -109,10 +150,9 @@ def extract_notam_records(raw_text: str) -> List[str]:
     (A1234/25 NOTAMN ...)
     This avoids splitting on blank lines that may appear inside E) bodies.
     """
-    text = raw_text.replace("\r\n", "\n").replace("\r", "\n").translate({0xA0: 0x20})
+    text = normalize_line_breaks(raw_text)
 
-    start_rx = re.compile(r"\([A-Z]\d{4}/\d{2}(?:[A-Z]\d{1,3})?\s+NOTAM[A-Z]?\b")
-    starts = [m.start() for m in start_rx.finditer(text)]
+    starts = [m.start() for m in RECORD_START_RE.finditer(text)]
     if not starts:
         separated = text.replace("\n\n(", "U7U7U7U7U7U7(")
         return [rec.strip() for rec in separated.split("U7U7U7U7U7U7") if rec.strip()]
@@ -128,15 +168,15 @@ def extract_notam_records(raw_text: str) -> List[str]:
 
 def normalize_record_text(record: str) -> str:
     """Normalize a single NOTAM record to improve parser tolerance."""
-    text = record.replace("\r\n", "\n").replace("\r", "\n").translate({0xA0: 0x20})
+    text = normalize_line_breaks(record)
     # Drop ICAO section headers like "USTV:" that appear between records
-    text = re.sub(r"(?m)^[A-Z]{3,5}:\s*$\n?", "", text)
+    text = SECTION_HEADER_RE.sub("", text)
     # Fix broken field labels like "D\n)" or "E\n)" produced by HTML line breaks
-    text = re.sub(r"([A-Z])\s*\n\s*\)", r"\1)", text)
+    text = BROKEN_LABEL_RE.sub(r"\1)", text)
     # Fix malformed Q) lines that contain a double slash in the field sequence
-    text = re.sub(r"(?m)^Q\)([^\n]*)//([^\n]*)$", r"Q)\1/\2", text)
+    text = Q_DOUBLE_SLASH_RE.sub(r"Q)\1/\2", text)
     # Remove blank lines that appear before a field label like "\n\nA)"
-    text = re.sub(r"\n\s*\n(?=[A-Z]\))", "\n", text)
+    text = BLANK_BEFORE_LABEL_RE.sub("\n", text)
     # Trim trailing whitespace on each line
     text = "\n".join(line.rstrip() for line in text.split("\n"))
     return text.strip()
@@ -144,48 +184,41 @@ def normalize_record_text(record: str) -> str:
 
 def fill_missing_q_line_fields(record: str) -> str:
     """Fill empty Q-line traffic and purpose fields with parser-safe defaults."""
-    updated = re.sub(
-        r"(?m)^Q\)([A-Z]{4}/[A-Z]{5})//([A-Z]{1,3})/",
-        r"Q)\1/IV/BO/\2/",
-        record,
-    )
-    return re.sub(
-        r"(?m)^Q\)([A-Z]{4}/[A-Z]{5})/([A-Z]{1,3})/(\d{3}/\d{3}/)",
-        r"Q)\1/IV/BO/\2/\3",
-        updated,
-    )
+    updated = Q_EMPTY_FIELDS_RE.sub(r"Q)\1/IV/BO/\2/", record)
+    return Q_MISSING_FIELDS_RE.sub(r"Q)\1/IV/BO/\2/\3", updated)
 
 
 def strip_airspace_class_parentheses(record: str) -> str:
     """Remove parenthetical airspace class markers that break pynotam parsing."""
-    return re.sub(r"\((AIRSPACE CLASS [A-Z])\)", r"\1", record)
+    return AIRSPACE_CLASS_PAREN_RE.sub(r"\1", record)
+
 
+def build_decode_candidates(record: str) -> Iterator[str]:
+    """Yield the record followed by parser fallbacks for common malformed patterns.
 
-def build_decode_candidates(record: str) -> list[str]:
-    """Build parser fallbacks for common malformed record patterns."""
+    Fallbacks are built lazily, so well-formed records that decode on the
+    first attempt never pay for the rewrites.
+    """
+    yield record
     candidates: list[str] = [record]
     transforms = [
         fill_missing_q_line_fields,
         strip_airspace_class_parentheses,
     ]
 
-    current_batch = [record]
     seen = {record}
     for transform in transforms:
-        next_batch: list[str] = []
-        for candidate in current_batch:
+        for candidate in candidates[:]:
             updated = transform(candidate)
             if updated not in seen:
                 seen.add(updated)
                 candidates.append(updated)
-                next_batch.append(updated)
-        current_batch = candidates.copy()
-    return candidates
+                yield updated
 
 
 def extract_notam_id(record: str) -> Optional[str]:
     """Extract the NOTAM identifier from the start of a raw record."""
-    match = re.match(r"^\(([A-Z]\d{4}/\d{2}(?:[A-Z]\d{1,3})?)\s+NOTAM", record)
+    match = RECORD_ID_RE.match(record)
     if match:
         return match.group(1)
     return None
@@ -338,10 +371,60 @@ abbr_map = {
 }
 
 
+def build_trie_pattern(words: Iterable[str]) -> str:
+    """Build a regex alternation for ``words`` with shared prefixes factored out.
+
+    ``["GBAS", "GLS", "GNSS"]`` becomes ``G(?:BAS|LS|NSS)``, so the regex engine
+    tests each leading character once instead of once per word.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def render(node: dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + render(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        is_word_end = "" in node
+        if len(branches) == 1 and not is_word_end:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if is_word_end else "")
+
+    return render(trie)
+
+
+ABBREVIATION_RE = re.compile(r"\b(?:" + build_trie_pattern(abbr_map) + r")\b")
+
+
 def expand_abbreviations(text: str) -> str:
-    for abbr, full in abbr_map.items():
-        text = re.sub(rf"\b{abbr}\b", full, text)
-    return text
+    """Expand known abbreviations in a single scan of the text.
+
+    Expansions are not rescanned, so an abbreviation inside an expansion (the
+    GNSS in "GNSS Landing System") is left as written, and "NOT AVBL" expands
+    as a whole instead of having its AVBL replaced first.
+    """
+    return ABBREVIATION_RE.sub(lambda m: abbr_map[m.group(0)], text)
+
+
+def write_geojson(out_path: str, geojson: dict[str, Any]) -> None:
+    """Write a FeatureCollection as indented UTF-8 JSON.
+
+    orjson is used when installed; its OPT_INDENT_2 output is byte-identical
+    to ``json.dump(..., indent=2, ensure_ascii=False)`` for GeoJSON content.
+    """
+    if orjson is not None:
+        with open(out_path, "wb") as f:
+            f.write(orjson.dumps(geojson, option=orjson.OPT_INDENT_2))
+        return
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(geojson, f, indent=2, ensure_ascii=False)
 
 
 def polygon_geometry(
@@ -483,6 +566,8 @@ def parse_notam_files(
         print(
             f"⚠ Airport CSV '{airports_csv}' not found; proceeding without airport enrichment."
         )
+    # (lon, lat) per ident, validated once for the geometry fallback
+    airport_points = normalize_airport_locations(airport_locations)
 
     success_count = 0
     failure_count = 0
@@ -492,12 +577,13 @@ def parse_notam_files(
 
     for file_path in html_files:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                soup = BeautifulSoup(f.read(), "html.parser")
+            # Decode in one go; CR/CRLF are normalised later in extract_notam_records
+            html = pathlib.Path(file_path).read_bytes().decode("utf-8")
         except FileNotFoundError:
             print(f"⚠ File not found: {file_path}")
             continue
         processed_files += 1
+        soup = BeautifulSoup(html, "html.parser")
 
         # remove clutter (guard: title tag may be missing in minimal test HTML)
         title_tag = soup.find("title")
@@ -544,47 +630,9 @@ def parse_notam_files(
             success_count += 1
 
             geometry: Optional[dict[str, Any]] = build_geometry(
-                decoded, airport_locations, MAX_CIRCLE_RADIUS_NM
+                decoded, airport_points, MAX_CIRCLE_RADIUS_NM
             )
 
-            traffic = getattr(decoded, "traffic_type", None)
-            purpose = getattr(decoded, "purpose", None)
-            scope = getattr(decoded, "scope", None)
-            locations_val = getattr(decoded, "location", None)
-            all_props = {
-                "notam_id": decoded.notam_id,
-                "notam_type": decoded.notam_type,
-                "fir": decoded.fir,
-                "notam_code": decoded.notam_code,
-                # Convert potential set/list fields to sorted lists (or keep None)
-                "traffic_type": (
-                    sorted(list(traffic))
-                    if isinstance(traffic, (set, list, tuple))
-                    else traffic
-                ),
-                "purpose": (
-                    sorted(list(purpose))
-                    if isinstance(purpose, (set, list, tuple))
-                    else purpose
-                ),
-                "scope": (
-                    sorted(list(scope))
-                    if isinstance(scope, (set, list, tuple))
-                    else scope
-                ),
-                "fl_lower": decoded.fl_lower,
-                "fl_upper": decoded.fl_upper,
-                "valid_from": str(decoded.valid_from),
-                "valid_till": str(decoded.valid_till),
-                "schedule": decoded.schedule,
-                "body": decoded.body,
-                "locations": (
-                    list(locations_val)
-                    if isinstance(locations_val, (set, list, tuple))
-                    else locations_val
-                ),
-                "area_raw": decoded.area,
-            }
             airport_name = None
             try:
                 if decoded.location:
@@ -605,8 +653,7 @@ def parse_notam_files(
 
         notam_class = file_path.split("/")[-1][0:1]
         out_path = f"{output}{notam_class}.geojson"
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(geojson, f, indent=2, ensure_ascii=False)
+        write_geojson(out_path, geojson)
         print(f"✅ Decoded NOTAMs saved to {out_path}")
 
     print(
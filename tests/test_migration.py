@@ -10,7 +10,12 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 # Import the NEW build_geometry
-from scripts.geo import build_geometry, MAX_CIRCLE_RADIUS_NM
+from scripts.geo import (
+    build_geometry,
+    e_text_geometry,
+    normalize_airport_locations,
+    MAX_CIRCLE_RADIUS_NM,
+)
 
 
 # Mock objects needed for testing
@@ -68,3 +73,36 @@ def test_migration_fallback_point():
     assert geom is not None
     assert geom["type"] == "Point"
     assert geom["coordinates"] == (37.0, 55.0)
+
+
+def test_migration_fallback_point_normalized_airports():
+    airports = {"UUWW": {"lon": 37.0, "lat": 55.0}, "XXXX": {"name": "no coords"}}
+    points = normalize_airport_locations(airports)
+    assert points == {"UUWW": (37.0, 55.0)}
+    geom = build_geometry(NotamStub(location=["UUWW"]), points)
+    assert geom is not None
+    assert geom["type"] == "Point"
+    assert geom["coordinates"] == (37.0, 55.0)
+
+
+def test_build_geometry_simplify_tolerance():
+    text = "AIRSPACE CLSD WI CIRCLE RADIUS 5KM CENTRE 612800N0401500E."
+    dense = build_geometry(text, {})
+    simplified = build_geometry(text, {}, simplify_tolerance_deg=1e-4)
+    assert dense is not None and simplified is not None
+    assert simplified["type"] == "Polygon"
+    assert len(simplified["coordinates"][0]) < len(dense["coordinates"][0])
+    assert simplified["meta"] == dense["meta"]
+
+
+def test_build_geometry_memoizes_text_parsing():
+    text = "AIRSPACE CLSD WI CIRCLE RADIUS 3KM CENTRE 612800N0401500E."
+    e_text_geometry.cache_clear()
+    first = build_geometry(text, {})
+    hits = e_text_geometry.cache_info().hits
+    again = build_geometry(NotamStub(body=text), {})
+    # The second call reuses the parsed geometry instead of re-parsing
+    assert e_text_geometry.cache_info().hits == hits + 1
+    assert again == first
+    # Each call gets its own dict, so callers may mutate the result
+    assert again is not first
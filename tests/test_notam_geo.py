@@ -5,10 +5,12 @@ import json
 import pytest
 from shapely.geometry import shape, Polygon
 
+from scripts import geo
 from scripts.geo import (
     parse_latlon_pair,
     parse_multi_latlon_seq,
     m_from_text,
+    build_arc,
     build_circle,
     build_line_corridor,
     build_sector,
@@ -23,6 +25,15 @@ def almost_equal(a, b, eps=1e-6):
     return abs(a - b) < eps
 
 
+def max_vertex_error_m(approx, exact):
+    """Largest geodesic distance (m) between matching exterior vertices."""
+    from pyproj import Geod
+
+    (ax, ay), (ex, ey) = approx.exterior.xy, exact.exterior.xy
+    _, _, dist = Geod(ellps="WGS84").inv(ax, ay, ex, ey)
+    return max(dist)
+
+
 def test_parse_latlon_pair():
     lon, lat = parse_latlon_pair("595835N0301229E")
     assert lat > 0 and lon > 0
@@ -54,6 +65,36 @@ def test_build_circle_area():
     assert abs(cy - center[1]) < 0.01
 
 
+@pytest.mark.parametrize("lat", [0.0, 45.0, 70.0])
+def test_build_circle_spherical_approx_close_to_exact(lat):
+    # Well inside the cap the error is a few centimetres
+    approx = build_circle((30.0, lat), 5000)
+    exact = build_circle((30.0, lat), 5000, use_spherical_approx=False)
+    assert max_vertex_error_m(approx, exact) < 0.05
+
+
+@pytest.mark.parametrize("lat", [0.0, 45.0, 70.0])
+def test_build_circle_spherical_approx_at_threshold(lat):
+    radius_m = geo.SPHERICAL_APPROX_MAX_RADIUS_M
+    approx = build_circle((30.0, lat), radius_m)
+    exact = build_circle((30.0, lat), radius_m, use_spherical_approx=False)
+    assert max_vertex_error_m(approx, exact) < 0.5
+
+
+def test_build_arc_spherical_approx_close_to_exact():
+    args = ((30.0, 60.0), 15000, (30.2, 60.05), (30.0, 59.9), True)
+    approx = build_arc(*args)
+    exact = build_arc(*args, use_spherical_approx=False)
+    assert max_vertex_error_m(approx, exact) < 0.5
+
+
+def test_build_circle_is_memoized():
+    first = build_circle((30.0, 60.0), 5000)
+    # Sub-centimetre differences in input hit the same cache entry
+    again = build_circle((30.0000000001, 60.0), 5000.01)
+    assert again is first
+
+
 def test_build_line_corridor():
     pts = [(30.0, 60.0), (30.1, 60.1)]
     poly = build_line_corridor(pts, 1000)
@@ -8,19 +8,27 @@ Focus areas:
  - Fallback polygon detection when no explicit AREA: tag
 """
 
+import json
+
 import pytest
 from shapely.geometry import shape, Polygon, MultiPolygon
 
 from scripts.geo import (
     dms_token_to_deg,
+    dms_digits_to_deg,
     parse_latlon_pair,
     parse_multi_latlon_seq,
     m_from_text,
     build_polygon,
+    build_parts_from_E,
     parse_notam_block,
     parse_notam_file_text,
+    split_notams,
+    extract_field,
+    extract_fields,
     parse_alt_text,
     notams_to_geojson,
+    notams_to_geojson_bytes,
 )
 
 
@@ -39,6 +47,15 @@ def test_dms_token_to_deg_invalid():
         dms_token_to_deg("123N")  # too short
 
 
+def test_dms_digits_to_deg_matches_scalar_decoder():
+    tokens = ["5958N", "06012S", "595835N", "0301229E", "03012W", "1794559W"]
+    nums = [t[:-1] for t in tokens]
+    hemis = [t[-1] for t in tokens]
+    vectorized = dms_digits_to_deg(nums, hemis)
+    for token, value in zip(tokens, vectorized):
+        assert pytest.approx(dms_token_to_deg(token), abs=1e-12) == value
+
+
 def test_parse_alt_text_variants():
     assert parse_alt_text("SFC") == {"type": "SFC"}
     assert parse_alt_text("GND") == {"type": "GND"}
@@ -96,6 +113,14 @@ def test_geojson_union_of_multiple_parts():
         assert len(geom["coordinates"]) == 2
 
 
+def test_geojson_bytes_matches_dict_output():
+    block = """(Q7776/25 NOTAMN\nE) AIRSPACE CLSD AS FLW:\n1. WI CIRCLE RADIUS 1KM CENTRE 585106N0304315E.\n2. WI CIRCLE RADIUS 1KM CENTRE 595106N0314315E.\nF) SFC  G) 150M AMSL)"""
+    nf = parse_notam_block(block)
+    assert nf is not None
+    as_dict = json.loads(json.dumps(notams_to_geojson([nf])))
+    assert json.loads(notams_to_geojson_bytes([nf])) == as_dict
+
+
 def test_parse_notam_block_missing_altitude_defaults():
     # Missing F)/G) should default F->SFC and G->UNL
     block = """(Q6666/25 NOTAMN\nE) AIRSPACE CLSD WI CIRCLE RADIUS 1KM CENTRE 585106N0304315E.)"""
@@ -107,6 +132,15 @@ def test_parse_notam_block_missing_altitude_defaults():
     assert part.altitude_to.get("raw") == "UNL"
 
 
+def test_extract_fields_matches_extract_field():
+    block = """(Q1762/25 NOTAMN\nA) ULLL B)2509100700 C)2509111400\nD)DAILY 0700-1400\nE) AIRSPACE CLSD WI CIRCLE RADIUS 1KM CENTRE 585106N0304315E.\nF) SFC  G) 150M AMSL)"""
+    fields = extract_fields(block)
+    assert set(fields) == set("ABCDEFG")
+    for code in "ABCDEFG":
+        assert fields[code] == extract_field(block, code)
+    assert fields["G"] == "150M AMSL"
+
+
 def test_m_from_text_errors():
     with pytest.raises(ValueError):
         m_from_text("BAD")
@@ -123,4 +157,38 @@ def test_parse_multi_latlon_seq_mixed_content():
     assert len(coords) == 2
 
 
+def test_build_parts_from_e_is_case_insensitive():
+    upper = "AIRSPACE CLSD WI ELLIPSE CENTRE 584622N0304438E WITH AXES DIMENSIONS 2.8X1.3NM AZM OF MAJOR AXIS 141DEG"
+    (up,) = build_parts_from_E(upper, {}, {})
+    (low,) = build_parts_from_E(upper.lower(), {}, {})
+    assert low.kind == up.kind == "ELLIPSE"
+    assert low.geom.equals_exact(up.geom, 1e-12)
+    # The matched text is kept in its original case
+    assert low.raw == low.raw.lower()
+    assert up.raw == up.raw.upper()
+
+
+@pytest.mark.parametrize("newline", ["\r\n", "\r"])
+def test_split_notams_handles_cr_line_endings(newline):
+    lf = """(Q1762/25 NOTAMN
+A) ULLL B)2509100700 C)2509111400
+E) AIRSPACE CLSD WI CIRCLE RADIUS 1KM CENTRE 585106N0304315E.
+
+(Q1763/25 NOTAMN
+A) ULLL B)2509100700 C)2509111400
+E) AIRSPACE CLSD."""
+    blocks = split_notams(lf.replace("\n", newline))
+    assert len(blocks) == 2
+    assert blocks == split_notams(lf)
+
+
+def test_non_ascii_digits_are_not_coordinates():
+    arabic_indic = "٥٩٥٨٣٥N٠٣٠١٢٢٩E"
+    assert parse_multi_latlon_seq(f"595835N0301229E-{arabic_indic}") == [
+        parse_latlon_pair("595835N0301229E")
+    ]
+    with pytest.raises(ValueError):
+        dms_token_to_deg("٥٩٥٨٣٥N")
+
+
 """End of extra tests."""
@@ -1,6 +1,8 @@
 from pathlib import Path
 
 from scripts.scraper import (
+    build_trie_pattern,
+    expand_abbreviations,
     extract_direct_notam_url,
     parse_html_entries,
     parse_html_list,
@@ -64,3 +66,18 @@ def test_extract_direct_notam_url_from_click_counter() -> None:
         url
         == "https://www.caica.ru/ANI_Official/notam/notam_series/A2605091253_eng.html"
     )
+
+
+def test_expand_abbreviations_single_pass() -> None:
+    text = "RWY 08 U/S. GLS NOT AVBL WI AD. ADJ ROAD"
+
+    assert expand_abbreviations(text) == (
+        "Runway 08 Unserviceable. GNSS Landing System Not Available "
+        "Within Aerodrome. ADJ ROAD"
+    )
+
+
+def test_build_trie_pattern_shares_prefixes() -> None:
+    pattern = build_trie_pattern(["GBAS", "GLS", "GNSS", "GPS", "NOT AVBL", "NOTAMR"])
+
+    assert pattern == r"(?:G(?:BAS|LS|NSS|PS)|NOT(?:\ AVBL|AMR))"